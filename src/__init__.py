@@ -13,28 +13,22 @@ __author__ = "Abayomi Ajayi"
 __email__ = "ajayi.abayomi5@gmail.com"
 __description__ = "AI-Powered Compound Disaster Risk Assessment System"
 
-# Import main classes for easy access
+# Import main classes and the emergency management constants for easy access
 try:
-    from .core_analytics import CompoundDisasterAnalytics
-    __all__ = ["CompoundDisasterAnalytics"]
+    from .core_analytics import (
+        FLOOD_THRESHOLD_PRECIP_INCHES,
+        HEAT_THRESHOLD_DURATION_DAYS,
+        HEAT_THRESHOLD_TEMP_F,
+        INFRASTRUCTURE_CRITICAL_THRESHOLD,
+        RISK_LEVELS,
+        CompoundDisasterAnalytics,
+        WeatherSample
+    )
+    __all__ = ["CompoundDisasterAnalytics", "WeatherSample"]
 except ImportError:
     # Handle case where core_analytics.py doesn't exist yet
     __all__ = []
 
-# Emergency management constants
-HEAT_THRESHOLD_TEMP_F = 95.0  # Fahrenheit
-HEAT_THRESHOLD_DURATION_DAYS = 3
-FLOOD_THRESHOLD_PRECIP_INCHES = 2.0
-INFRASTRUCTURE_CRITICAL_THRESHOLD = 1800  # MW
-
-# Risk level constants
-RISK_LEVELS = {
-    'LOW': (0.0, 0.3),
-    'MODERATE': (0.3, 0.6), 
-    'HIGH': (0.6, 0.8),
-    'EXTREME': (0.8, 1.0)
-}
-
 # Current emergency context
 CURRENT_HEAT_DOME_INFO = {
     'temperature': 103,  # Current heat dome conditions
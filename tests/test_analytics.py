@@ -0,0 +1,304 @@
+"""
+Tests for the core analytics engine.
+
+Covers the single-sample prediction API and keeps the vectorized batch
+scoring path in step with the scalar scoring rules.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from src.core_analytics import (
+    _REC_EXTREME_HEAT,
+    _REC_FLOOD_RISK,
+    _REC_GRID_STRESS,
+    _RECS_EXTREME,
+    _RECS_HIGH,
+    _RECS_MODERATE,
+    CompoundDisasterAnalytics,
+    WeatherSample,
+    _risk_score_kernel,
+    _score_general_regime
+)
+
+from . import CURRENT_HEAT_DOME_CONDITIONS
+
+# Values straddling every threshold used by the scoring rules
+BOUNDARY_TEMPERATURES = [85.0, 90.0, 94.9, 95.0, 99.9, 100.0, 103.5, 104.9, 105.0, 110.0, 115.0]
+BOUNDARY_PRECIPITATION = [0.0, 0.45, 0.5, 1.9, 2.0, 3.1, 4.5]
+BOUNDARY_HUMIDITY = [50.0, 70.0, 85.0]
+BOUNDARY_POWER_DEMAND = [1500.0, 1600.0, 1600.5, 1800.0, 1800.5, 1900.0, 1900.5, 2000.0, 2300.0]
+BOUNDARY_SOIL_MOISTURE = [15.0, 20.0, 30.0]
+
+FEATURES = ['temperature', 'precipitation', 'humidity', 'power_demand', 'soil_moisture']
+
+
+@pytest.fixture
+def engine():
+    """Analytics engine with default thresholds."""
+    return CompoundDisasterAnalytics()
+
+
+@pytest.fixture
+def boundary_grid():
+    """Every combination of the boundary values, one row per sample."""
+    return np.array(list(itertools.product(
+        BOUNDARY_TEMPERATURES,
+        BOUNDARY_PRECIPITATION,
+        BOUNDARY_HUMIDITY,
+        BOUNDARY_POWER_DEMAND,
+        BOUNDARY_SOIL_MOISTURE
+    )))
+
+
+def test_scoring_kernels_are_compiled():
+    """With numba installed the parity tests below run the compiled kernels."""
+    numba = pytest.importorskip('numba')
+
+    assert isinstance(_risk_score_kernel, numba.core.registry.CPUDispatcher)
+
+
+def test_batch_matches_scalar_predictions(engine, boundary_grid):
+    """Batch scoring agrees with predict_compound_risk on every boundary."""
+    temps, precips, humidities, power_demands, soil_moistures = boundary_grid.T
+
+    risk_scores = engine._calculate_risk_score_batch(
+        temps, precips, humidities, power_demands, soil_moistures
+    )
+    risk_levels = engine._get_risk_level(risk_scores)
+    anomalies = engine._detect_anomaly_batch(temps, precips, humidities, power_demands)
+    impacts = engine._assess_infrastructure_impact(power_demands)
+
+    for i, row in enumerate(boundary_grid):
+        result = engine.predict_compound_risk(dict(zip(FEATURES, row)))
+
+        assert risk_scores[i] == pytest.approx(result['risk_score']), row
+        assert risk_levels[i] == result['risk_level'], row
+        assert anomalies[i] == result['is_anomaly'], row
+        assert impacts[i] == result['infrastructure_impact'], row
+
+
+@pytest.mark.parametrize('risk_score, expected_level', [
+    (0.0, 'Low'),
+    (0.2999, 'Low'),
+    (0.3, 'Moderate'),
+    (0.5999, 'Moderate'),
+    (0.6, 'High'),
+    (0.7999, 'High'),
+    (0.8, 'Extreme'),
+    (1.0, 'Extreme')
+])
+def test_risk_level_boundaries(engine, risk_score, expected_level):
+    """Risk level lower bounds are inclusive for scalars and arrays alike."""
+    assert engine._get_risk_level(risk_score) == expected_level
+    assert engine._get_risk_level(np.array([risk_score]))[0] == expected_level
+
+
+def test_predict_compound_risk_batch_frame(engine):
+    """predict_compound_risk_batch scores a DataFrame, filling missing columns."""
+    pd = pytest.importorskip('pandas')
+    conditions = {
+        feature: value for feature, value in CURRENT_HEAT_DOME_CONDITIONS.items()
+        if feature != 'soil_moisture'
+    }
+
+    batch = engine.predict_compound_risk_batch(pd.DataFrame([conditions], index=['today']))
+    result = engine.predict_compound_risk(conditions)
+
+    assert list(batch.index) == ['today']
+    assert batch.loc['today', 'risk_score'] == pytest.approx(result['risk_score'])
+    assert batch.loc['today', 'risk_level'] == result['risk_level']
+    assert batch.loc['today', 'is_anomaly'] == result['is_anomaly']
+    assert batch.loc['today', 'infrastructure_impact'] == result['infrastructure_impact']
+
+
+def test_prediction_labels_are_plain_str(engine):
+    """Single-sample labels are Python strings, safe for any serializer."""
+    result = engine.predict_compound_risk(CURRENT_HEAT_DOME_CONDITIONS)
+
+    assert type(result['risk_level']) is str
+    assert type(result['infrastructure_impact']) is str
+
+
+@pytest.mark.parametrize('input_data, error', [
+    (None, TypeError),
+    ([103, 0.1, 65, 1850], TypeError),
+    ({'temperature': None}, TypeError),
+    ({'temperature': 'scorching'}, ValueError)
+])
+def test_predict_compound_risk_rejects_bad_input(engine, input_data, error):
+    """Invalid conditions raise instead of returning a placeholder result."""
+    with pytest.raises(error):
+        engine.predict_compound_risk(input_data)
+
+
+def test_weather_sample_stores_floats():
+    """WeatherSample converts integer and string conditions to float."""
+    sample = WeatherSample(temperature=103, power_demand='1850')
+
+    assert type(sample.temperature) is float
+    assert type(sample.power_demand) is float
+    assert sample.temperature == 103.0
+
+
+@pytest.mark.parametrize('flood_threshold', [2.0, 0.2])
+def test_heat_regime_shortcut_matches_general_scoring(boundary_grid, flood_threshold):
+    """The heat-dome fast path scores exactly like the general rules."""
+    infra_threshold = CompoundDisasterAnalytics.infrastructure_critical_threshold
+
+    for row in boundary_grid:
+        assert _risk_score_kernel(*row, infra_threshold, flood_threshold) == pytest.approx(
+            _score_general_regime(*row, infra_threshold, flood_threshold)
+        ), row
+
+
+def test_flood_threshold_override_keeps_batch_parity(engine):
+    """A lowered flood threshold applies to scalar and batch scoring alike."""
+    engine.flood_threshold_precipitation = 0.2
+    conditions = [91.0, 0.45, 50.0, 1500.0, 30.0]
+
+    scalar_score = engine._calculate_risk_score(*conditions)
+    batch_score = engine._calculate_risk_score_batch(*np.array([conditions]).T)[0]
+
+    assert scalar_score == pytest.approx(0.09)
+    assert batch_score == pytest.approx(scalar_score)
+
+
+def test_risk_threshold_override_per_instance():
+    """Risk thresholds passed at construction drive that instance's levels only."""
+    strict = CompoundDisasterAnalytics(risk_thresholds={
+        'Low': (0.0, 0.2),
+        'Moderate': (0.2, 0.4),
+        'High': (0.4, 0.5),
+        'Extreme': (0.5, 1.0)
+    })
+
+    assert strict._get_risk_level(0.55) == 'Extreme'
+    assert CompoundDisasterAnalytics()._get_risk_level(0.55) == 'Moderate'
+
+
+def test_standardize_features_uses_precomputed_scaling(engine):
+    """Features are standardized with the stored mean and inverse std."""
+    features = np.array([[100.0, 0.1, 60.0, 1800.0, 30.0], [90.0, 1.1, 70.0, 1600.0, 20.0]])
+    mean = features.mean(axis=0)
+    scale = features.std(axis=0)
+
+    assert engine.standardize_features(features) == pytest.approx(features)
+
+    engine.set_feature_scaling(mean, scale)
+    standardized = engine.standardize_features(features)
+
+    assert standardized.dtype == np.float32
+    assert standardized == pytest.approx((features - mean) / scale, rel=1e-5)
+
+
+@pytest.mark.parametrize('mean, scale', [
+    ([1.0], [1.0] * 5),
+    ([0.0] * 5, [[1.0] * 5]),
+    ([0.0] * 4, [1.0] * 4),
+    ([0.0] * 5, [1.0, 1.0, 0.0, 1.0, 1.0])
+])
+def test_set_feature_scaling_rejects_wrong_shape(engine, mean, scale):
+    """Scaling statistics need one entry per feature and a non-zero scale."""
+    with pytest.raises(ValueError):
+        engine.set_feature_scaling(mean, scale)
+
+
+@pytest.mark.parametrize('power_demand, expected_impact', [
+    (1500.0, 'Low'),
+    (1600.0, 'Low'),
+    (1600.5, 'Moderate'),
+    (1800.0, 'Moderate'),
+    (1900.0, 'High'),
+    (1900.5, 'Critical'),
+    (float('nan'), 'Low')
+])
+def test_infrastructure_impact_boundaries(engine, power_demand, expected_impact):
+    """Impact bounds are exclusive, and unknown demand stays 'Low', for scalars and arrays."""
+    assert engine._assess_infrastructure_impact(power_demand) == expected_impact
+    assert engine._assess_infrastructure_impact(np.array([power_demand]))[0] == expected_impact
+
+
+@pytest.mark.parametrize('risk_level, temp, precip, power_demand, expected', [
+    ('Extreme', 101.0, 3.5, 1900.0, _RECS_EXTREME + (_REC_EXTREME_HEAT, _REC_GRID_STRESS, _REC_FLOOD_RISK)),
+    ('High', 90.0, 0.0, 1500.0, _RECS_HIGH),
+    ('High', 90.0, 0.0, 1860.0, _RECS_HIGH + (_REC_GRID_STRESS,)),
+    ('Moderate', 90.0, 3.5, 1500.0, _RECS_MODERATE + (_REC_FLOOD_RISK,)),
+    ('Low', 90.0, 0.0, 1500.0, ()),
+    ('Low', 101.0, 0.0, 1500.0, (_REC_EXTREME_HEAT,))
+])
+def test_recommendations(engine, risk_level, temp, precip, power_demand, expected):
+    """Base tuple per risk level, then heat, grid and flood extras in that order."""
+    recommendations = engine._generate_recommendations(risk_level, temp, precip, power_demand)
+
+    assert isinstance(recommendations, tuple)
+    assert recommendations == expected
+
+
+def test_recommendation_base_tuples():
+    """Each risk level keeps its full set of base recommendations."""
+    assert len(_RECS_EXTREME) == 6
+    assert len(_RECS_HIGH) == 5
+    assert len(_RECS_MODERATE) == 4
+    assert _RECS_EXTREME[0] == "🚨 EMERGENCY: Activate all cooling centers immediately"
+
+
+def test_analysis_time_is_opt_in(engine):
+    """analysis_time is only added when include_timestamp is set."""
+    assert 'analysis_time' not in engine.predict_compound_risk(CURRENT_HEAT_DOME_CONDITIONS)
+
+    result = engine.predict_compound_risk(CURRENT_HEAT_DOME_CONDITIONS, include_timestamp=True)
+
+    assert isinstance(result['analysis_time'], str)
+    assert isinstance(result['recommendations'], tuple)
+
+
+def test_float32_batch_stays_float32(engine, boundary_grid):
+    """float32 batches score in float32 and agree with the float64 path."""
+    float64_scores = engine._calculate_risk_score_batch(*boundary_grid.T)
+    float32_scores = engine._calculate_risk_score_batch(*boundary_grid.astype(np.float32).T)
+
+    assert float64_scores.dtype == np.float64
+    assert float32_scores.dtype == np.float32
+    assert float32_scores == pytest.approx(float64_scores, abs=1e-5)
+
+
+def test_shared_risk_thresholds_are_read_only(engine):
+    """The class-level risk thresholds cannot be mutated through an instance."""
+    with pytest.raises(TypeError):
+        engine.risk_thresholds['High'] = (0.5, 0.8)
+
+
+def test_package_reexports_engine_constants():
+    """Package-level constants are the ones the engine uses, not copies."""
+    import src
+    from src import core_analytics
+
+    assert src.RISK_LEVELS is core_analytics.RISK_LEVELS
+    assert src.INFRASTRUCTURE_CRITICAL_THRESHOLD == CompoundDisasterAnalytics.infrastructure_critical_threshold
+
+
+def test_validate_system_reports_single_failed_check(engine, monkeypatch):
+    """Each mask bit maps back to its own check name."""
+    result = engine.predict_compound_risk(CURRENT_HEAT_DOME_CONDITIONS)
+    monkeypatch.setattr(engine, 'predict_compound_risk', lambda conditions: {**result, 'confidence': 2})
+
+    validation = engine.validate_system()
+
+    assert validation['system_status'] == 'ISSUES_DETECTED'
+    assert validation['validation_checks'] == {
+        'prediction_successful': True,
+        'risk_level_assigned': True,
+        'recommendations_generated': True,
+        'confidence_calculated': False
+    }
+
+
+def test_validate_system_operational(engine):
+    """A healthy engine passes every validation check."""
+    validation = engine.validate_system()
+
+    assert validation['system_status'] == 'OPERATIONAL'
+    assert all(validation['validation_checks'].values())